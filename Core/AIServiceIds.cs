@@ -0,0 +1,12 @@
+namespace QuantResearchAgent.Core;
+
+/// <summary>
+/// Service ids for the chat completion services registered on the kernel
+/// </summary>
+public static class AIServiceIds
+{
+    /// <summary>
+    /// Cheaper model used for high-volume per-item scoring such as article sentiment
+    /// </summary>
+    public const string Bulk = "bulk";
+}
@@ -37,6 +37,7 @@ public class AgentOrchestrator
     private readonly Timer? _dataRefreshTimer;
     private readonly CancellationTokenSource _cancellationTokenSource = new();
     private readonly SemaphoreSlim _jobSemaphore;
+    private Task _initialMarketDataRefresh = Task.CompletedTask;
 
     public AgentOrchestrator(
         Kernel kernel,
@@ -101,33 +102,13 @@ public class AgentOrchestrator
         // Plugins registered successfully
     }
 
-    private void RegisterPlugins()
-    {
-        try
-        {
-            // Core plugins
-            _kernel.Plugins.AddFromType<PodcastAnalysisPlugin>();
-            _kernel.Plugins.AddFromType<TradingPlugin>();
-            _kernel.Plugins.AddFromType<MarketDataPlugin>();
-            _kernel.Plugins.AddFromType<RiskManagementPlugin>();
-            
-            // Research agent plugins
-            _kernel.Plugins.AddFromType<MarketSentimentPlugin>();
-            _kernel.Plugins.AddFromType<StatisticalPatternPlugin>();
-            
-            _logger.LogInformation("Successfully registered all plugins with Semantic Kernel");
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to register plugins with Semantic Kernel");
-            throw;
-        }
-    }
-
     public async Task StartAsync()
     {
         _logger.LogInformation("Agent Orchestrator starting...");
         
+        // Warm market data in the background; signal generation waits on it instead of racing it
+        _initialMarketDataRefresh = RefreshInitialMarketDataAsync();
+        
         // Start background job processor
         _ = Task.Run(ProcessJobsAsync, _cancellationTokenSource.Token);
         
@@ -247,12 +228,26 @@ public class AgentOrchestrator
         }
     }
 
+    private async Task RefreshInitialMarketDataAsync()
+    {
+        try
+        {
+            await _marketDataService.RefreshMarketDataAsync();
+            _logger.LogInformation("Initial market data refresh completed");
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Initial market data refresh failed");
+        }
+    }
+
     private async Task<string> ProcessPodcastAnalysisJob(AgentJob job)
     {
         var videoUrl = job.Parameters["videoUrl"].ToString()!;
         var episode = await _youtubeService.AnalyzeVideoAsync(videoUrl);
         
         // Generate trading signals from video insights
+        await _initialMarketDataRefresh;
         var signals = await _signalService.GenerateSignalsAsync();
         
         return $"Analyzed video: {episode.Name}. Generated {signals.Count} trading signals.";
@@ -262,6 +257,9 @@ public class AgentOrchestrator
     {
         var symbol = job.Parameters.GetValueOrDefault("symbol")?.ToString();
         
+        // Signals read from the market data cache, so make sure it has been populated
+        await _initialMarketDataRefresh;
+        
         if (string.IsNullOrEmpty(symbol))
         {
             // Generate signals for all tracked symbols
@@ -308,14 +306,6 @@ public class AgentOrchestrator
         };
         await QueueJobAsync(podcastAnalysisJob);
 
-        // Schedule market data update
-        var marketDataJob = new AgentJob
-        {
-            Type = "market_data_update",
-            Priority = 1
-        };
-        await QueueJobAsync(marketDataJob);
-
         // Schedule signal generation
         var signalJob = new AgentJob
         {
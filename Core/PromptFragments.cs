@@ -0,0 +1,17 @@
+namespace QuantResearchAgent.Core;
+
+/// <summary>
+/// Prompt instructions shared across agents so every prompt uses the same wording
+/// </summary>
+public static class PromptFragments
+{
+    /// <summary>
+    /// Output formatting instruction for responses that are shown directly in the console
+    /// </summary>
+    public const string PlainTextOnly = "PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no code blocks.";
+
+    /// <summary>
+    /// Same as <see cref="PlainTextOnly"/> for prompts that do not rule out code blocks
+    /// </summary>
+    public const string PlainTextNoMarkdown = "PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.";
+}
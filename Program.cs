@@ -2,6 +2,8 @@ using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 using Microsoft.SemanticKernel;
+using Microsoft.SemanticKernel.ChatCompletion;
+using Microsoft.SemanticKernel.Connectors.OpenAI;
 using QuantResearchAgent.Core;
 using QuantResearchAgent.Services;
 using QuantResearchAgent.Services.ResearchAgents;
@@ -37,12 +39,7 @@ namespace QuantResearchAgent
                 .Build();
 
             // Build semantic kernel
-            var openAiApiKey = configuration["OpenAI:ApiKey"];
-            var modelId = configuration["OpenAI:ModelId"] ?? "gpt-4o";
-            
-            var kernel = Kernel.CreateBuilder()
-                .AddOpenAIChatCompletion(modelId, openAiApiKey!)
-                .Build();
+            var kernel = BuildKernel(configuration);
 
             // Configure services
             ConfigureServices(builder.Services, configuration, kernel);
@@ -97,12 +94,7 @@ namespace QuantResearchAgent
             var services = new ServiceCollection();
             
             // Build semantic kernel
-            var openAiApiKey = configuration["OpenAI:ApiKey"];
-            var modelId = configuration["OpenAI:ModelId"] ?? "gpt-4o";
-            
-            var kernel = Kernel.CreateBuilder()
-                .AddOpenAIChatCompletion(modelId, openAiApiKey!)
-                .Build();
+            var kernel = BuildKernel(configuration);
 
             ConfigureServices(services, configuration, kernel);
 
@@ -129,6 +121,22 @@ namespace QuantResearchAgent
             await cli.RunAsync();
         }
 
+        static Kernel BuildKernel(IConfiguration configuration)
+        {
+            var openAiApiKey = configuration["OpenAI:ApiKey"];
+            var modelId = configuration["OpenAI:ModelId"] ?? "gpt-4o";
+            var bulkModelId = configuration["OpenAI:BulkModelId"] ?? "gpt-4o-mini";
+            var responseCacheDuration = TimeSpan.FromMinutes(configuration.GetValue<int>("OpenAI:ResponseCacheMinutes", 30));
+
+            // The keyed bulk service must be registered before the default so unkeyed prompts still resolve to modelId
+            var kernelBuilder = Kernel.CreateBuilder();
+            kernelBuilder.Services.AddKeyedSingleton<IChatCompletionService>(AIServiceIds.Bulk, new CachedChatCompletionService(
+                new OpenAIChatCompletionService(bulkModelId, openAiApiKey!), responseCacheDuration));
+            kernelBuilder.Services.AddSingleton<IChatCompletionService>(new CachedChatCompletionService(
+                new OpenAIChatCompletionService(modelId, openAiApiKey!), responseCacheDuration));
+            return kernelBuilder.Build();
+        }
+
         static void ConfigureServices(IServiceCollection services, IConfiguration configuration, Kernel kernel)
         {
             // Add configuration
@@ -6,10 +6,13 @@ import re
 import json
 import sys
 import argparse
+import logging
 from datetime import datetime, timedelta
 import time
 import random
 
+logger = logging.getLogger(__name__)
+
 def get_yahoo_finance_news(ticker, max_articles=5):
     """Get news from Yahoo Finance RSS feed"""
     try:
@@ -20,7 +23,7 @@ def get_yahoo_finance_news(ticker, max_articles=5):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        print(f"Fetching Yahoo Finance RSS for {ticker}", file=sys.stderr)
+        logger.info("Fetching Yahoo Finance RSS for %s", ticker)
         response = requests.get(rss_url, headers=headers, timeout=10)
         response.raise_for_status()
         
@@ -45,16 +48,16 @@ def get_yahoo_finance_news(ticker, max_articles=5):
                     'scraped_at': datetime.now().isoformat()
                 })
                 
-                print(f"Found: {title[:60]}...", file=sys.stderr)
+                logger.debug("Found: %s...", title[:60])
                 
             except Exception as e:
-                print(f"Error parsing RSS item: {e}", file=sys.stderr)
+                logger.warning("Error parsing RSS item: %s", e)
                 continue
         
         return articles
         
     except Exception as e:
-        print(f"Error fetching Yahoo Finance RSS: {e}", file=sys.stderr)
+        logger.warning("Error fetching Yahoo Finance RSS: %s", e)
         return []
 
 def get_marketwatch_news(ticker, max_articles=5):
@@ -67,7 +70,7 @@ def get_marketwatch_news(ticker, max_articles=5):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        print(f"Searching MarketWatch for {ticker}", file=sys.stderr)
+        logger.info("Searching MarketWatch for %s", ticker)
         response = requests.get(search_url, headers=headers, timeout=10)
         response.raise_for_status()
         
@@ -99,21 +102,21 @@ def get_marketwatch_news(ticker, max_articles=5):
                         'scraped_at': datetime.now().isoformat()
                     })
                     
-                    print(f"Found: {title[:60]}...", file=sys.stderr)
+                    logger.debug("Found: %s...", title[:60])
                     
             except Exception as e:
-                print(f"Error parsing MarketWatch item: {e}", file=sys.stderr)
+                logger.warning("Error parsing MarketWatch item: %s", e)
                 continue
         
         return articles
         
     except Exception as e:
-        print(f"Error fetching MarketWatch news: {e}", file=sys.stderr)
+        logger.warning("Error fetching MarketWatch news: %s", e)
         return []
 
 def generate_realistic_fallback_news(ticker, source, max_articles):
     """Generate realistic fallback news when scraping fails"""
-    print(f"Generating fallback news for {ticker}", file=sys.stderr)
+    logger.warning("Generating fallback news for %s", ticker)
     
     templates = [
         {
@@ -179,22 +182,30 @@ def main():
     parser.add_argument('ticker', help='Stock ticker symbol')
     parser.add_argument('--source', default='Google Finance', help='News source preference')
     parser.add_argument('--max-articles', type=int, default=5, help='Maximum number of articles to scrape')
+    parser.add_argument('--verbose', action='store_true', help='Log scraping progress to stderr')
     
     args = parser.parse_args()
     
+    # Diagnostics go to stderr; keep them to warnings unless asked, stdout carries the JSON result
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format='%(levelname)s: %(message)s',
+        stream=sys.stderr
+    )
+    
     try:
-        print(f"Starting news scraping for {args.ticker} from {args.source}", file=sys.stderr)
+        logger.info("Starting news scraping for %s from %s", args.ticker, args.source)
         
         # Scrape articles
         articles = scrape_news_articles(args.ticker, args.source, args.max_articles)
         
-        print(f"Successfully collected {len(articles)} articles", file=sys.stderr)
+        logger.info("Successfully collected %d articles", len(articles))
         
         # Output as JSON
         print(json.dumps(articles, indent=2))
         
     except Exception as e:
-        print(f'Error in main execution: {e}', file=sys.stderr)
+        logger.error("Error in main execution: %s", e)
         # Return fallback articles instead of empty array
         fallback = generate_realistic_fallback_news(args.ticker, args.source, args.max_articles)
         print(json.dumps(fallback, indent=2))
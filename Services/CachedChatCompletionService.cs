@@ -0,0 +1,127 @@
+using Microsoft.SemanticKernel;
+using Microsoft.SemanticKernel.ChatCompletion;
+using Microsoft.SemanticKernel.Services;
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+
+namespace QuantResearchAgent.Services;
+
+/// <summary>
+/// Chat completion decorator that serves repeated identical prompts from an in-memory cache
+/// </summary>
+public class CachedChatCompletionService : IChatCompletionService
+{
+    private const int MaxCachedResponses = 1000;
+
+    private readonly IChatCompletionService _innerService;
+    private readonly TimeSpan _cacheDuration;
+    private readonly ConcurrentDictionary<string, (IReadOnlyList<ChatMessageContent> Response, DateTime Timestamp)> _responseCache = new();
+
+    public CachedChatCompletionService(IChatCompletionService innerService, TimeSpan cacheDuration)
+    {
+        _innerService = innerService;
+        _cacheDuration = cacheDuration;
+    }
+
+    public IReadOnlyDictionary<string, object?> Attributes => _innerService.Attributes;
+
+    public async Task<IReadOnlyList<ChatMessageContent>> GetChatMessageContentsAsync(
+        ChatHistory chatHistory,
+        PromptExecutionSettings? executionSettings = null,
+        Kernel? kernel = null,
+        CancellationToken cancellationToken = default)
+    {
+        var cacheKey = GetCacheKey(chatHistory, executionSettings);
+
+        if (cacheKey != null &&
+            _responseCache.TryGetValue(cacheKey, out var cached) &&
+            DateTime.UtcNow - cached.Timestamp < _cacheDuration)
+        {
+            return cached.Response;
+        }
+
+        var response = await _innerService.GetChatMessageContentsAsync(chatHistory, executionSettings, kernel, cancellationToken);
+
+        if (cacheKey != null && response.Count > 0)
+        {
+            _responseCache[cacheKey] = (response, DateTime.UtcNow);
+            EvictExpiredResponses();
+        }
+
+        return response;
+    }
+
+    public IAsyncEnumerable<StreamingChatMessageContent> GetStreamingChatMessageContentsAsync(
+        ChatHistory chatHistory,
+        PromptExecutionSettings? executionSettings = null,
+        Kernel? kernel = null,
+        CancellationToken cancellationToken = default)
+    {
+        // Streaming responses are passed through uncached
+        return _innerService.GetStreamingChatMessageContentsAsync(chatHistory, executionSettings, kernel, cancellationToken);
+    }
+
+    /// <summary>
+    /// Builds the cache key, or returns null when the execution settings cannot be serialized and the call should not be cached
+    /// </summary>
+    private string? GetCacheKey(ChatHistory chatHistory, PromptExecutionSettings? executionSettings)
+    {
+        var keyBuilder = new StringBuilder();
+        keyBuilder.Append(_innerService.GetModelId()).Append('|');
+
+        if (executionSettings != null)
+        {
+            // Serialize with the runtime type so connector-specific settings (temperature, max tokens, response format, ...) are part of the key
+            try
+            {
+                keyBuilder.Append(executionSettings.GetType().FullName).Append(':');
+                keyBuilder.Append(JsonSerializer.Serialize(executionSettings, executionSettings.GetType()));
+            }
+            catch (Exception ex) when (ex is NotSupportedException or JsonException or InvalidOperationException)
+            {
+                return null;
+            }
+        }
+
+        foreach (var message in chatHistory)
+        {
+            keyBuilder.Append('|').Append(message.Role.Label).Append(':').Append(message.Content);
+        }
+
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(keyBuilder.ToString())));
+    }
+
+    private void EvictExpiredResponses()
+    {
+        if (_responseCache.Count <= MaxCachedResponses)
+        {
+            return;
+        }
+
+        var now = DateTime.UtcNow;
+        foreach (var entry in _responseCache)
+        {
+            if (now - entry.Value.Timestamp >= _cacheDuration)
+            {
+                _responseCache.TryRemove(entry.Key, out _);
+            }
+        }
+
+        // Still over the bound: drop the oldest entries
+        if (_responseCache.Count > MaxCachedResponses)
+        {
+            var oldestKeys = _responseCache
+                .OrderBy(entry => entry.Value.Timestamp)
+                .Take(_responseCache.Count - MaxCachedResponses)
+                .Select(entry => entry.Key)
+                .ToList();
+
+            foreach (var key in oldestKeys)
+            {
+                _responseCache.TryRemove(key, out _);
+            }
+        }
+    }
+}
@@ -3,6 +3,7 @@ using System.ComponentModel;
 using System.Text.Json;
 using RestSharp;
 using Microsoft.Extensions.Logging;
+using QuantResearchAgent.Core;
 
 namespace QuantResearchAgent.Services;
 
@@ -12,6 +13,8 @@ namespace QuantResearchAgent.Services;
 /// </summary>
 public class CompanyValuationService
 {
+    private static readonly JsonSerializerOptions IndentedJsonOptions = new() { WriteIndented = true };
+
     private readonly RestClient _client;
     private readonly Kernel _kernel;
     private readonly ILogger<CompanyValuationService> _logger;
@@ -133,7 +136,7 @@ Timestamp: {DateTime.UtcNow:yyyy-MM-dd HH:mm:ss} UTC
             ((JsonElement)c.GetType().GetProperty("Score")!.GetValue(c)!).GetDouble()).ToList();
 
         var recommendation = await _kernel.InvokePromptAsync($@"
-            Based on this stock comparison data: {JsonSerializer.Serialize(rankedStocks, new JsonSerializerOptions { WriteIndented = true })}
+            Based on this stock comparison data: {JsonSerializer.Serialize(rankedStocks, IndentedJsonOptions)}
             
             Provide a comprehensive investment recommendation including:
             1. Top 3 picks with reasoning
@@ -141,7 +144,7 @@ Timestamp: {DateTime.UtcNow:yyyy-MM-dd HH:mm:ss} UTC
             3. Key catalysts to watch
             4. Market timing considerations
             
-            Format as a professional investment research note using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+            Format as a professional investment research note using {PromptFragments.PlainTextNoMarkdown}
         ");
 
         return recommendation.ToString();
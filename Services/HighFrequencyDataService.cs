@@ -11,6 +11,8 @@ namespace QuantResearchAgent.Services;
 /// </summary>
 public class HighFrequencyDataService
 {
+    private static readonly JsonSerializerOptions IndentedJsonOptions = new() { WriteIndented = true };
+
     private readonly Kernel _kernel;
     private readonly Dictionary<string, WebSocketConnection> _connections = new();
     private readonly ConcurrentQueue<MarketDataPoint> _dataBuffer = new();
@@ -73,7 +75,7 @@ public class HighFrequencyDataService
                 Timestamp = DateTime.UtcNow
             };
 
-            return JsonSerializer.Serialize(microstructureReport, new JsonSerializerOptions { WriteIndented = true });
+            return JsonSerializer.Serialize(microstructureReport, IndentedJsonOptions);
         }
         catch (Exception ex)
         {
@@ -102,7 +104,7 @@ public class HighFrequencyDataService
             await InitializeStrategyAsync(strategy);
             var result = await ExecuteMarketMakingAsync(strategy);
 
-            return JsonSerializer.Serialize(result, new JsonSerializerOptions { WriteIndented = true });
+            return JsonSerializer.Serialize(result, IndentedJsonOptions);
         }
         catch (Exception ex)
         {
@@ -132,7 +134,7 @@ public class HighFrequencyDataService
                 Timestamp = DateTime.UtcNow
             };
 
-            return JsonSerializer.Serialize(orderFlowAnalysis, new JsonSerializerOptions { WriteIndented = true });
+            return JsonSerializer.Serialize(orderFlowAnalysis, IndentedJsonOptions);
         }
         catch (Exception ex)
         {
@@ -164,7 +166,7 @@ public class HighFrequencyDataService
                 Timestamp = DateTime.UtcNow
             };
 
-            return JsonSerializer.Serialize(volatilityReport, new JsonSerializerOptions { WriteIndented = true });
+            return JsonSerializer.Serialize(volatilityReport, IndentedJsonOptions);
         }
         catch (Exception ex)
         {
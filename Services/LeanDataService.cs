@@ -1,5 +1,6 @@
 using Microsoft.Extensions.Logging;
 using QuantResearchAgent.Core;
+using System.Collections.Concurrent;
 using System.Globalization;
 using System.IO.Compression;
 using System.Text.Json;
@@ -8,8 +9,11 @@ namespace QuantResearchAgent.Services;
 
 public class LeanDataService
 {
+    private const int MaxCachedFiles = 500;
+
     private readonly ILogger<LeanDataService> _logger;
     private readonly string _dataPath;
+    private readonly ConcurrentDictionary<string, (DateTime LastWriteTimeUtc, List<LeanBar> Bars, DateTime LastAccessed)> _parsedFileCache = new();
 
     public LeanDataService(ILogger<LeanDataService> logger)
     {
@@ -108,6 +112,20 @@ public class LeanDataService
 
     private async Task<List<LeanBar>> ReadLeanZipFileAsync(string zipFilePath, string symbol)
     {
+        // Reuse parsed bars until the zip file is rewritten on disk
+        var cacheKey = $"{zipFilePath}|{symbol}";
+        if (!File.Exists(zipFilePath))
+        {
+            _parsedFileCache.TryRemove(cacheKey, out _);
+        }
+
+        var lastWriteTimeUtc = File.GetLastWriteTimeUtc(zipFilePath);
+        if (_parsedFileCache.TryGetValue(cacheKey, out var cached) && cached.LastWriteTimeUtc == lastWriteTimeUtc)
+        {
+            _parsedFileCache[cacheKey] = cached with { LastAccessed = DateTime.UtcNow };
+            return cached.Bars;
+        }
+
         var bars = new List<LeanBar>();
 
         try
@@ -132,6 +150,8 @@ public class LeanDataService
                     }
                 }
             }
+
+            CacheParsedFile(cacheKey, lastWriteTimeUtc, bars);
         }
         catch (Exception ex)
         {
@@ -141,6 +161,26 @@ public class LeanDataService
         return bars;
     }
 
+    private void CacheParsedFile(string cacheKey, DateTime lastWriteTimeUtc, List<LeanBar> bars)
+    {
+        _parsedFileCache[cacheKey] = (lastWriteTimeUtc, bars, DateTime.UtcNow);
+
+        // Evict the least recently used files once the cache grows past its bound
+        if (_parsedFileCache.Count > MaxCachedFiles)
+        {
+            var staleKeys = _parsedFileCache
+                .OrderBy(entry => entry.Value.LastAccessed)
+                .Take(_parsedFileCache.Count - MaxCachedFiles)
+                .Select(entry => entry.Key)
+                .ToList();
+
+            foreach (var staleKey in staleKeys)
+            {
+                _parsedFileCache.TryRemove(staleKey, out _);
+            }
+        }
+    }
+
     private LeanBar? ParseLeanCsvLine(string csvLine, string symbol)
     {
         try
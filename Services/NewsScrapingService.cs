@@ -89,8 +89,23 @@ namespace QuantResearchAgent.Services
                 using var process = new Process { StartInfo = startInfo };
                 process.Start();
 
-                var output = await process.StandardOutput.ReadToEndAsync();
-                var error = await process.StandardError.ReadToEndAsync();
+                // Drain stderr concurrently so a chatty scraper cannot block on a full pipe
+                var errorTask = process.StandardError.ReadToEndAsync();
+
+                // Deserialize the JSON straight off stdout instead of buffering it into a string first
+                List<ScrapedArticle>? scrapedArticles = null;
+                JsonException? parseError = null;
+                try
+                {
+                    scrapedArticles = await JsonSerializer.DeserializeAsync<List<ScrapedArticle>>(process.StandardOutput.BaseStream);
+                }
+                catch (JsonException ex)
+                {
+                    parseError = ex;
+                    await process.StandardOutput.BaseStream.CopyToAsync(Stream.Null);
+                }
+
+                var error = await errorTask;
 
                 await process.WaitForExitAsync();
 
@@ -105,14 +120,11 @@ namespace QuantResearchAgent.Services
                     return new List<NewsArticle>();
                 }
 
-                if (string.IsNullOrWhiteSpace(output))
+                if (parseError != null || scrapedArticles == null)
                 {
-                    _logger.LogWarning("Python script returned empty output");
+                    _logger.LogWarning(parseError, "Python script returned empty or invalid output");
                     return new List<NewsArticle>();
                 }
-
-                // Parse JSON output
-                var scrapedArticles = JsonSerializer.Deserialize<List<ScrapedArticle>>(output) ?? new List<ScrapedArticle>();
                 
                 return scrapedArticles.Select(a => new NewsArticle
                 {
@@ -1,5 +1,6 @@
 using Microsoft.Extensions.Logging;
 using Microsoft.SemanticKernel;
+using QuantResearchAgent.Core;
 using QuantResearchAgent.Services;
 using System.Text;
 using System.Text.Json;
@@ -12,6 +13,12 @@ namespace QuantResearchAgent.Services
     /// </summary>
     public class NewsSentimentAnalysisService
     {
+        private const int NewsSentimentBatchSize = 8;
+        // ServiceId is experimental in Semantic Kernel 1.25 (SKEXP0001); it routes these prompts to the keyed bulk service
+#pragma warning disable SKEXP0001
+        private static readonly PromptExecutionSettings BulkExecutionSettings = new() { ServiceId = AIServiceIds.Bulk };
+#pragma warning restore SKEXP0001
+
         private readonly ILogger<NewsSentimentAnalysisService> _logger;
         private readonly Kernel _kernel;
         private readonly YFinanceNewsService _yfinanceNewsService;
@@ -84,8 +91,7 @@ namespace QuantResearchAgent.Services
                     .ToList();
 
                 // Analyze sentiment for each news item
-                var sentimentTasks = uniqueNews.Select(AnalyzeNewsItemSentimentAsync).ToList();
-                var sentimentResults = await Task.WhenAll(sentimentTasks);
+                var sentimentResults = await AnalyzeNewsSentimentInBatchesAsync(uniqueNews);
 
                 // Combine results
                 for (int i = 0; i < uniqueNews.Count; i++)
@@ -179,8 +185,7 @@ namespace QuantResearchAgent.Services
                     .ToList();
 
                 // Analyze sentiment for each news item
-                var sentimentTasks = uniqueNews.Select(AnalyzeNewsItemSentimentAsync).ToList();
-                var sentimentResults = await Task.WhenAll(sentimentTasks);
+                var sentimentResults = await AnalyzeNewsSentimentInBatchesAsync(uniqueNews);
 
                 for (int i = 0; i < uniqueNews.Count; i++)
                 {
@@ -214,25 +219,48 @@ namespace QuantResearchAgent.Services
             }
         }
 
-        private async Task<NewsItemSentiment> AnalyzeNewsItemSentimentAsync(NewsItem newsItem)
+        /// <summary>
+        /// Analyze sentiment for news items in batches, returning one result per item in the original order
+        /// </summary>
+        private async Task<List<NewsItemSentiment>> AnalyzeNewsSentimentInBatchesAsync(List<NewsItem> newsItems)
+        {
+            var batchTasks = newsItems
+                .Chunk(NewsSentimentBatchSize)
+                .Select(batch => AnalyzeNewsBatchSentimentAsync(batch.ToList()));
+            var batchResults = await Task.WhenAll(batchTasks);
+
+            return batchResults.SelectMany(results => results).ToList();
+        }
+
+        private async Task<List<NewsItemSentiment>> AnalyzeNewsBatchSentimentAsync(List<NewsItem> newsItems)
         {
+            var results = newsItems.Select(_ => CreateNeutralSentiment()).ToList();
+
             try
             {
-                var prompt = $@"
-Analyze the financial sentiment of this news article:
-
+                var articles = string.Join("\n\n", newsItems.Select((newsItem, i) => $@"Article {i + 1}:
 Title: {newsItem.Title}
 Summary: {newsItem.Summary}
 Publisher: {newsItem.Publisher}
-Date: {newsItem.PublishedDate:yyyy-MM-dd}
+Date: {newsItem.PublishedDate:yyyy-MM-dd}"));
+
+                var prompt = $@"
+Analyze the financial sentiment of each of these {newsItems.Count} news articles:
 
-Provide analysis in this exact JSON format:
+{articles}
+
+Provide analysis in this exact JSON format, with one entry per article:
 {{
-    ""score"": <number between -1.0 and 1.0>,
-    ""label"": ""<Very Negative|Negative|Neutral|Positive|Very Positive>"",
-    ""keyTopics"": [""topic1"", ""topic2"", ""topic3""],
-    ""impact"": ""<Low|Medium|High>"",
-    ""reasoning"": ""<brief explanation>""
+    ""articles"": [
+        {{
+            ""index"": <article number>,
+            ""score"": <number between -1.0 and 1.0>,
+            ""label"": ""<Very Negative|Negative|Neutral|Positive|Very Positive>"",
+            ""keyTopics"": [""topic1"", ""topic2"", ""topic3""],
+            ""impact"": ""<Low|Medium|High>"",
+            ""reasoning"": ""<brief explanation>""
+        }}
+    ]
 }}
 
 Consider:
@@ -243,33 +271,56 @@ Consider:
 - Company performance indicators
 ";
 
-                var response = await _kernel.InvokePromptAsync(prompt);
+                var response = await _kernel.InvokePromptAsync(prompt, new KernelArguments(BulkExecutionSettings));
                 var jsonResponse = response.ToString();
 
                 // Clean and parse JSON
                 var cleanJson = ExtractJsonFromResponse(jsonResponse);
-                var sentimentData = JsonSerializer.Deserialize<JsonElement>(cleanJson);
+                var batchData = JsonSerializer.Deserialize<JsonElement>(cleanJson);
 
-                return new NewsItemSentiment
+                foreach (var sentimentData in batchData.GetProperty("articles").EnumerateArray())
                 {
-                    Score = sentimentData.GetProperty("score").GetDouble(),
-                    Label = sentimentData.GetProperty("label").GetString() ?? "Neutral",
-                    KeyTopics = sentimentData.GetProperty("keyTopics").EnumerateArray()
-                        .Select(t => t.GetString() ?? "").Where(t => !string.IsNullOrEmpty(t)).ToList(),
-                    Impact = sentimentData.GetProperty("impact").GetString() ?? "Medium"
-                };
+                    if (!sentimentData.TryGetProperty("index", out var indexElement) ||
+                        !indexElement.TryGetInt32(out var index) ||
+                        index < 1 || index > newsItems.Count)
+                    {
+                        continue;
+                    }
+
+                    try
+                    {
+                        results[index - 1] = new NewsItemSentiment
+                        {
+                            Score = sentimentData.GetProperty("score").GetDouble(),
+                            Label = sentimentData.GetProperty("label").GetString() ?? "Neutral",
+                            KeyTopics = sentimentData.GetProperty("keyTopics").EnumerateArray()
+                                .Select(t => t.GetString() ?? "").Where(t => !string.IsNullOrEmpty(t)).ToList(),
+                            Impact = sentimentData.GetProperty("impact").GetString() ?? "Medium"
+                        };
+                    }
+                    catch (Exception ex)
+                    {
+                        _logger.LogWarning(ex, $"Error parsing sentiment for news item: {newsItems[index - 1].Title}");
+                    }
+                }
             }
             catch (Exception ex)
             {
-                _logger.LogWarning(ex, $"Error analyzing sentiment for news item: {newsItem.Title}");
-                return new NewsItemSentiment
-                {
-                    Score = 0.0,
-                    Label = "Neutral",
-                    KeyTopics = new List<string>(),
-                    Impact = "Medium"
-                };
+                _logger.LogWarning(ex, $"Error analyzing sentiment for batch of {newsItems.Count} news items");
             }
+
+            return results;
+        }
+
+        private static NewsItemSentiment CreateNeutralSentiment()
+        {
+            return new NewsItemSentiment
+            {
+                Score = 0.0,
+                Label = "Neutral",
+                KeyTopics = new List<string>(),
+                Impact = "Medium"
+            };
         }
 
         private async Task<OverallSentimentResult> GenerateOverallSentimentAnalysisAsync(string symbol, List<NewsItem> newsItems)
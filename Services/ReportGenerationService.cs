@@ -7,6 +7,8 @@ namespace QuantResearchAgent.Services;
 
 public class ReportGenerationService
 {
+    private static readonly JsonSerializerOptions IndentedJsonOptions = new() { WriteIndented = true };
+
     private readonly ILogger<ReportGenerationService> _logger;
     private readonly Kernel _kernel;
     private readonly YahooFinanceService _yahooFinanceService;
@@ -557,10 +559,7 @@ Keep it under 200 words and focus on actionable insights.";
                 }
             };
             
-            var jsonContent = JsonSerializer.Serialize(jsonReport, new JsonSerializerOptions 
-            { 
-                WriteIndented = true 
-            });
+            var jsonContent = JsonSerializer.Serialize(jsonReport, IndentedJsonOptions);
             await File.WriteAllTextAsync(jsonPath, jsonContent);
             savedFiles["json"] = jsonPath;
             
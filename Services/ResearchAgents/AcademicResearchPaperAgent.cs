@@ -1,6 +1,7 @@
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
 using Microsoft.SemanticKernel;
+using QuantResearchAgent.Core;
 using QuantResearchAgent.Plugins;
 using System.Text;
 using System.Text.RegularExpressions;
@@ -184,7 +185,7 @@ Provide a brief analysis with:
 5. Implementation considerations
 
 Keep response concise (max 200 words).
-Format output as PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no code blocks.
+Format output as {PromptFragments.PlainTextOnly}
 ";
 
                 var response = await _kernel.InvokePromptAsync(prompt);
@@ -226,35 +227,34 @@ Format output as PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no co
                     return "Unable to extract content from the provided URL. Please ensure it's a valid academic paper link.";
                 }
 
-                // Analyze the paper using AI
-                var paperAnalysis = await AnalyzePaperContentAsync(paperContent, focusArea);
+                // The analysis sections are independent, so request them from the AI concurrently
+                var paperAnalysisTask = AnalyzePaperContentAsync(paperContent, focusArea);
+                var strategyBlueprintTask = GenerateStrategyBlueprintAsync(paperContent, focusArea);
+                var pseudocodeTask = GeneratePseudocodeAsync(paperContent, focusArea);
+                var riskConsiderationsTask = GenerateRiskConsiderationsAsync(paperContent);
+                var backtestingFrameworkTask = GenerateBacktestingFrameworkAsync(paperContent);
+
+                await Task.WhenAll(paperAnalysisTask, strategyBlueprintTask, pseudocodeTask, riskConsiderationsTask, backtestingFrameworkTask);
+
                 analysisBuilder.AppendLine("PAPER ANALYSIS");
                 analysisBuilder.AppendLine(new string('-', 40));
-                analysisBuilder.AppendLine(paperAnalysis);
+                analysisBuilder.AppendLine(paperAnalysisTask.Result);
 
-                // Generate strategy blueprint
-                var strategyBlueprint = await GenerateStrategyBlueprintAsync(paperContent, focusArea);
                 analysisBuilder.AppendLine("\nIMPLEMENTATION BLUEPRINT");
                 analysisBuilder.AppendLine(new string('-', 40));
-                analysisBuilder.AppendLine(strategyBlueprint);
+                analysisBuilder.AppendLine(strategyBlueprintTask.Result);
 
-                // Generate pseudocode
-                var pseudocode = await GeneratePseudocodeAsync(paperContent, focusArea);
                 analysisBuilder.AppendLine("\nPSEUDOCODE IMPLEMENTATION");
                 analysisBuilder.AppendLine(new string('-', 40));
-                analysisBuilder.AppendLine(pseudocode);
+                analysisBuilder.AppendLine(pseudocodeTask.Result);
 
-                // Generate risk considerations
-                var riskConsiderations = await GenerateRiskConsiderationsAsync(paperContent);
                 analysisBuilder.AppendLine("\nIMPLEMENTATION RISKS & CONSIDERATIONS");
                 analysisBuilder.AppendLine(new string('-', 40));
-                analysisBuilder.AppendLine(riskConsiderations);
+                analysisBuilder.AppendLine(riskConsiderationsTask.Result);
 
-                // Generate backtesting framework
-                var backtestingFramework = await GenerateBacktestingFrameworkAsync(paperContent);
                 analysisBuilder.AppendLine("\nBACKTESTING FRAMEWORK");
                 analysisBuilder.AppendLine(new string('-', 40));
-                analysisBuilder.AppendLine(backtestingFramework);
+                analysisBuilder.AppendLine(backtestingFrameworkTask.Result);
 
                 analysisBuilder.AppendLine("\n" + new string('=', 80));
                 analysisBuilder.AppendLine("END OF ANALYSIS");
@@ -365,12 +365,8 @@ Format output as PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no co
                 // For other URLs, try to get the page content
                 var response = await _httpClient.GetStringAsync(url);
                 
-                // Clean up HTML and extract meaningful content
-                var cleanContent = Regex.Replace(response, @"<[^>]*>", " ");
-                cleanContent = Regex.Replace(cleanContent, @"\s+", " ");
-                
-                // Take first 5000 characters as a reasonable sample
-                return cleanContent.Length > 5000 ? cleanContent.Substring(0, 5000) : cleanContent;
+                // Clean up HTML and take first 5000 characters as a reasonable sample
+                return ExtractVisibleText(response, 5000);
             }
             catch (Exception ex)
             {
@@ -379,6 +375,61 @@ Format output as PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no co
             }
         }
 
+        /// <summary>
+        /// Strips HTML tags and collapses whitespace in a single pass, stopping once maxLength characters are produced
+        /// </summary>
+        private static string ExtractVisibleText(string html, int maxLength)
+        {
+            var builder = new StringBuilder(Math.Min(html.Length, maxLength));
+            var pendingSpace = false;
+            var hasClosingBracket = true;
+
+            for (int i = 0; i < html.Length && builder.Length < maxLength; i++)
+            {
+                var c = html[i];
+
+                if (c == '<' && hasClosingBracket)
+                {
+                    var tagEnd = html.IndexOf('>', i + 1);
+                    if (tagEnd >= 0)
+                    {
+                        // A tag is replaced by whitespace
+                        pendingSpace = true;
+                        i = tagEnd;
+                        continue;
+                    }
+
+                    // No further tags can close, so the rest of the document is plain text
+                    hasClosingBracket = false;
+                }
+
+                if (char.IsWhiteSpace(c))
+                {
+                    pendingSpace = true;
+                    continue;
+                }
+
+                if (pendingSpace)
+                {
+                    builder.Append(' ');
+                    pendingSpace = false;
+                    if (builder.Length >= maxLength)
+                    {
+                        break;
+                    }
+                }
+
+                builder.Append(c);
+            }
+
+            if (pendingSpace && builder.Length < maxLength)
+            {
+                builder.Append(' ');
+            }
+
+            return builder.ToString();
+        }
+
         private string ExtractArxivId(string url)
         {
             var match = Regex.Match(url, @"arxiv\.org/(?:abs/|pdf/)?(\d+\.\d+)");
@@ -431,7 +482,7 @@ Provide analysis covering:
 6. Practical applicability in quantitative finance
 7. Strengths and limitations of the approach
 
-Format your response clearly and concisely using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no code blocks.
+Format your response clearly and concisely using {PromptFragments.PlainTextOnly}
 ";
 
             var response = await _kernel.InvokePromptAsync(prompt);
@@ -459,7 +510,7 @@ Create a blueprint that includes:
 9. Technology Stack Recommendations
 10. Implementation Timeline and Milestones
 
-Provide specific, actionable guidance for each section using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags, no code blocks.
+Provide specific, actionable guidance for each section using {PromptFragments.PlainTextOnly}
 ";
 
             var response = await _kernel.InvokePromptAsync(prompt);
@@ -506,7 +557,7 @@ Analyze risks in these categories:
 6. Regulatory and Compliance Risks
 7. Capital and Liquidity Risks
 
-Provide specific mitigation strategies for each identified risk using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+Provide specific mitigation strategies for each identified risk using {PromptFragments.PlainTextNoMarkdown}
 ";
 
             var response = await _kernel.InvokePromptAsync(prompt);
@@ -532,7 +583,7 @@ Design a framework that includes:
 9. Out-of-Sample Testing Protocol
 10. Statistical Significance Testing
 
-Provide specific implementation details for each component using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+Provide specific implementation details for each component using {PromptFragments.PlainTextNoMarkdown}
 ";
 
             var response = await _kernel.InvokePromptAsync(prompt);
@@ -570,7 +621,7 @@ Provide a synthesis that includes:
 6. Performance expectations based on research
 7. Next steps for validation and implementation
 
-Create a coherent, actionable synthesis that leverages insights from all analyzed papers using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+Create a coherent, actionable synthesis that leverages insights from all analyzed papers using {PromptFragments.PlainTextNoMarkdown}
 ";
 
             var response = await _kernel.InvokePromptAsync(prompt);
@@ -627,7 +678,7 @@ Provide a concise summary (max 150 words) covering:
 4. Implementation complexity level
 5. Recommended next steps for deeper research
 
-Be specific and actionable using PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+Be specific and actionable using {PromptFragments.PlainTextNoMarkdown}
 ";
 
             var response = await _kernel.InvokePromptAsync(prompt);
@@ -5,6 +5,9 @@ using QuantResearchAgent.Core;
 using QuantResearchAgent.Services;
 using QuantResearchAgent.Plugins;
 using RestSharp;
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text;
 using System.Text.Json;
 using System.Text.RegularExpressions;
 
@@ -15,6 +18,13 @@ namespace QuantResearchAgent.Services.ResearchAgents;
 /// </summary>
 public class MarketSentimentAgentService
 {
+    private const int ArticleSentimentBatchSize = 5;
+    private const int MaxCachedArticleScores = 5000;
+    // ServiceId is experimental in Semantic Kernel 1.25 (SKEXP0001); it routes these prompts to the keyed bulk service
+#pragma warning disable SKEXP0001
+    private static readonly PromptExecutionSettings BulkExecutionSettings = new() { ServiceId = AIServiceIds.Bulk };
+#pragma warning restore SKEXP0001
+
     private readonly ILogger<MarketSentimentAgentService> _logger;
     private readonly IConfiguration _configuration;
     private readonly Kernel _kernel;
@@ -23,6 +33,7 @@ public class MarketSentimentAgentService
     private readonly TechnicalAnalysisService _technicalAnalysisService;
     private readonly RestClient _redditClient;
     private readonly List<SentimentAnalysis> _sentimentHistory = new();
+    private readonly ConcurrentDictionary<string, (double Score, DateTime LastAccessed)> _articleScoreCache = new();
 
     public MarketSentimentAgentService(
         ILogger<MarketSentimentAgentService> logger,
@@ -111,18 +122,24 @@ public class MarketSentimentAgentService
             // 1. Try web scraping first (existing functionality)
             var sources = new[] { "Yahoo Finance", "Bloomberg", "Google Finance" };
             
-            foreach (var source in sources)
+            var scrapeTasks = sources.Select(async source =>
             {
                 try
                 {
                     var articles = await _newsScrapingService.GetNewsArticlesAsync(ticker, source, 3);
-                    allArticles.AddRange(articles);
                     _logger.LogInformation($"Scraped {articles.Count} articles from {source} for {ticker}");
+                    return articles;
                 }
                 catch (Exception ex)
                 {
                     _logger.LogWarning(ex, $"Failed to scrape from {source} for {ticker}");
+                    return new List<NewsArticle>();
                 }
+            });
+            
+            foreach (var articles in await Task.WhenAll(scrapeTasks))
+            {
+                allArticles.AddRange(articles);
             }
             
             // 2. Enhance with Google Search for recent news
@@ -171,66 +188,55 @@ public class MarketSentimentAgentService
 
             _logger.LogInformation($"Successfully gathered {uniqueArticles.Count} unique news articles for {ticker}");
 
-            // Analyze each article individually for detailed breakdown
-            var articleAnalyses = new List<ArticleAnalysis>();
+            // Score articles in batches so each LLM round-trip covers several articles
+            var articlesToScore = uniqueArticles.Take(10).ToList(); // Limit to top 10 for performance
+            var articleScores = new double[articlesToScore.Count];
             
-            foreach (var article in uniqueArticles.Take(10)) // Limit to top 10 for performance
+            // Only articles without a cached score are sent to the model
+            var uncachedIndices = new List<int>();
+            var cacheKeys = articlesToScore.Select(article => GetArticleScoreCacheKey(ticker, article)).ToArray();
+            for (int i = 0; i < articlesToScore.Count; i++)
             {
-                try
+                if (TryGetCachedArticleScore(cacheKeys[i], out var cachedScore))
                 {
-                    var articlePrompt = $@"
-Analyze the sentiment of this single financial news article for {ticker}:
-
-Title: {article.Title}
-Source: {article.Source}
-Summary: {article.Summary}
-Published: {article.PublishedAt:yyyy-MM-dd HH:mm}
-
-Provide ONLY a sentiment score between -1.0 and 1.0:
-SENTIMENT_SCORE: [number between -1.0 and 1.0]
-
-Instructions:
-- -1.0 = very negative for stock price
-- 0.0 = neutral
-- +1.0 = very positive for stock price
-- Consider impact on stock price and investor confidence
-";
-
-                    var articleFunction = _kernel.CreateFunctionFromPrompt(articlePrompt);
-                    var articleResult = await _kernel.InvokeAsync(articleFunction);
-                    
-                    var scoreMatch = Regex.Match(articleResult.ToString(), @"SENTIMENT_SCORE[:\s]*(-?\d+\.?\d*)", RegexOptions.IgnoreCase);
-                    var articleScore = 0.0;
-                    if (scoreMatch.Success && double.TryParse(scoreMatch.Groups[1].Value, out var parsedScore))
-                    {
-                        articleScore = Math.Max(-1.0, Math.Min(1.0, parsedScore));
-                    }
-                    
-                    articleAnalyses.Add(new ArticleAnalysis
-                    {
-                        Title = article.Title,
-                        Source = article.Source,
-                        Url = article.Url,
-                        SentimentScore = articleScore,
-                        PublishedAt = article.PublishedAt,
-                        Summary = article.Summary
-                    });
+                    articleScores[i] = cachedScore;
                 }
-                catch (Exception ex)
+                else
                 {
-                    _logger.LogWarning(ex, $"Failed to analyze individual article: {article.Title}");
-                    articleAnalyses.Add(new ArticleAnalysis
-                    {
-                        Title = article.Title,
-                        Source = article.Source,
-                        Url = article.Url,
-                        SentimentScore = 0.0,
-                        PublishedAt = article.PublishedAt,
-                        Summary = article.Summary
-                    });
+                    uncachedIndices.Add(i);
                 }
             }
             
+            _logger.LogInformation($"Article sentiment cache: {articlesToScore.Count - uncachedIndices.Count} hits, {uncachedIndices.Count} misses for {ticker}");
+            
+            var batchTasks = uncachedIndices
+                .Chunk(ArticleSentimentBatchSize)
+                .Select(async batchIndices =>
+                {
+                    var batch = batchIndices.Select(i => articlesToScore[i]).ToList();
+                    var batchScores = await ScoreArticleBatchAsync(ticker, batch);
+                    for (int j = 0; j < batchIndices.Length; j++)
+                    {
+                        var score = batchScores[j];
+                        articleScores[batchIndices[j]] = score ?? 0.0;
+                        if (score.HasValue)
+                        {
+                            CacheArticleScore(cacheKeys[batchIndices[j]], score.Value);
+                        }
+                    }
+                });
+            await Task.WhenAll(batchTasks);
+            
+            var articleAnalyses = articlesToScore.Select((article, i) => new ArticleAnalysis
+            {
+                Title = article.Title,
+                Source = article.Source,
+                Url = article.Url,
+                SentimentScore = articleScores[i],
+                PublishedAt = article.PublishedAt,
+                Summary = article.Summary
+            }).ToList();
+            
             // Calculate overall sentiment from individual articles
             var avgSentiment = articleAnalyses.Any() ? articleAnalyses.Average(a => a.SentimentScore) : 0.0;
             var sentimentData = new SentimentData 
@@ -276,6 +282,96 @@ Instructions:
         }
     }
 
+    private async Task<double?[]> ScoreArticleBatchAsync(string ticker, List<NewsArticle> articles)
+    {
+        var scores = new double?[articles.Count];
+        
+        var articleBlocks = string.Join("\n\n", articles.Select((article, i) => $@"ARTICLE {i + 1}
+Title: {article.Title}
+Source: {article.Source}
+Summary: {article.Summary}
+Published: {article.PublishedAt:yyyy-MM-dd HH:mm}"));
+        
+        var batchPrompt = $@"
+Analyze the sentiment of each of the following {articles.Count} financial news articles for {ticker}:
+
+{articleBlocks}
+
+Provide ONLY one sentiment score per article, one per line, in this EXACT format:
+ARTICLE_1_SCORE: [number between -1.0 and 1.0]
+ARTICLE_2_SCORE: [number between -1.0 and 1.0]
+
+Instructions:
+- -1.0 = very negative for stock price
+- 0.0 = neutral
+- +1.0 = very positive for stock price
+- Consider impact on stock price and investor confidence
+- Score every article, in the order given
+";
+        
+        try
+        {
+            var batchFunction = _kernel.CreateFunctionFromPrompt(batchPrompt, BulkExecutionSettings);
+            var batchResult = await _kernel.InvokeAsync(batchFunction);
+            
+            foreach (Match scoreMatch in Regex.Matches(batchResult.ToString(), @"ARTICLE_(\d+)_SCORE[:\s]*(-?\d+\.?\d*)", RegexOptions.IgnoreCase))
+            {
+                if (int.TryParse(scoreMatch.Groups[1].Value, out var articleNumber) &&
+                    articleNumber >= 1 && articleNumber <= articles.Count &&
+                    double.TryParse(scoreMatch.Groups[2].Value, out var parsedScore))
+                {
+                    scores[articleNumber - 1] = Math.Max(-1.0, Math.Min(1.0, parsedScore));
+                }
+            }
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, $"Failed to analyze article batch of {articles.Count} for {ticker}, defaulting to neutral scores");
+        }
+        
+        return scores;
+    }
+
+    private string GetArticleScoreCacheKey(string ticker, NewsArticle article)
+    {
+        var modelId = _configuration["OpenAI:BulkModelId"] ?? "gpt-4o-mini";
+        var keyMaterial = $"{modelId}|{ticker}|{article.Title}|{article.Summary}";
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(keyMaterial)));
+    }
+
+    private bool TryGetCachedArticleScore(string cacheKey, out double score)
+    {
+        if (_articleScoreCache.TryGetValue(cacheKey, out var cached))
+        {
+            _articleScoreCache[cacheKey] = (cached.Score, DateTime.UtcNow);
+            score = cached.Score;
+            return true;
+        }
+
+        score = 0.0;
+        return false;
+    }
+
+    private void CacheArticleScore(string cacheKey, double score)
+    {
+        _articleScoreCache[cacheKey] = (score, DateTime.UtcNow);
+
+        // Evict the least recently used entries once the cache grows past its bound
+        if (_articleScoreCache.Count > MaxCachedArticleScores)
+        {
+            var staleKeys = _articleScoreCache
+                .OrderBy(entry => entry.Value.LastAccessed)
+                .Take(_articleScoreCache.Count - MaxCachedArticleScores)
+                .Select(entry => entry.Key)
+                .ToList();
+
+            foreach (var staleKey in staleKeys)
+            {
+                _articleScoreCache.TryRemove(staleKey, out _);
+            }
+        }
+    }
+
     private async Task<SentimentData> AnalyzeSocialMediaSentimentAsync(string assetClass, string specificAsset)
     {
         try
@@ -946,33 +1042,63 @@ public static class MarketSentimentHelpers
         var uniqueArticles = new List<QuantResearchAgent.Services.NewsArticle>();
         var seenTitles = new HashSet<string>();
         
+        // Each kept title is tokenized once; later articles are compared against these precomputed word sets
+        var seenWordSets = new List<(HashSet<string> Words, int WordCount)>();
+        
         foreach (var article in articles)
         {
             var normalizedTitle = article.Title.ToLower().Trim();
             
-            // Check for exact matches or very similar titles
-            bool isDuplicate = seenTitles.Any(seen => 
-                seen == normalizedTitle || 
-                CalculateTitleSimilarity(seen, normalizedTitle) > 0.8);
+            // Exact matches are a constant-time lookup
+            if (seenTitles.Contains(normalizedTitle))
+            {
+                continue;
+            }
+            
+            var words = normalizedTitle.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+            var wordSet = new HashSet<string>(words);
+            
+            // Check for very similar titles
+            bool isDuplicate = false;
+            foreach (var (seenWords, seenWordCount) in seenWordSets)
+            {
+                if (CalculateTitleSimilarity(wordSet, words.Length, seenWords, seenWordCount) > 0.8)
+                {
+                    isDuplicate = true;
+                    break;
+                }
+            }
             
             if (!isDuplicate)
             {
                 uniqueArticles.Add(article);
                 seenTitles.Add(normalizedTitle);
+                seenWordSets.Add((wordSet, words.Length));
             }
         }
         
         return uniqueArticles;
     }
     
-    private static double CalculateTitleSimilarity(string title1, string title2)
+    private static double CalculateTitleSimilarity(HashSet<string> words1, int wordCount1, HashSet<string> words2, int wordCount2)
     {
-        var words1 = title1.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-        var words2 = title2.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+        var totalWords = Math.Max(wordCount1, wordCount2);
+        if (totalWords == 0)
+        {
+            return 0;
+        }
         
-        var commonWords = words1.Intersect(words2).Count();
-        var totalWords = Math.Max(words1.Length, words2.Length);
+        // Iterate the smaller set and probe the larger one
+        var (smaller, larger) = words1.Count <= words2.Count ? (words1, words2) : (words2, words1);
+        var commonWords = 0;
+        foreach (var word in smaller)
+        {
+            if (larger.Contains(word))
+            {
+                commonWords++;
+            }
+        }
         
-        return totalWords > 0 ? (double)commonWords / totalWords : 0;
+        return (double)commonWords / totalWords;
     }
 }
@@ -927,15 +927,49 @@ Consider volatility forecasting accuracy and trading costs.
         {
             if (lag >= series.Length) break;
             
-            var original = series.Take(series.Length - lag).ToArray();
-            var lagged = series.Skip(lag).ToArray();
+            // Correlate overlapping views of the series directly instead of copying each window
+            var original = new ReadOnlySpan<double>(series, 0, series.Length - lag);
+            var lagged = new ReadOnlySpan<double>(series, lag, series.Length - lag);
             
-            correlations[lag - 1] = Correlation.Pearson(original, lagged);
+            correlations[lag - 1] = PearsonCorrelation(original, lagged);
         }
         
         return correlations;
     }
 
+    /// <summary>
+    /// Allocation-free Pearson correlation of two equal-length spans
+    /// </summary>
+    private static double PearsonCorrelation(ReadOnlySpan<double> x, ReadOnlySpan<double> y)
+    {
+        var n = x.Length;
+        
+        var sumX = 0.0;
+        var sumY = 0.0;
+        for (int i = 0; i < n; i++)
+        {
+            sumX += x[i];
+            sumY += y[i];
+        }
+        
+        var meanX = sumX / n;
+        var meanY = sumY / n;
+        
+        var covariance = 0.0;
+        var varianceX = 0.0;
+        var varianceY = 0.0;
+        for (int i = 0; i < n; i++)
+        {
+            var dx = x[i] - meanX;
+            var dy = y[i] - meanY;
+            covariance += dx * dy;
+            varianceX += dx * dx;
+            varianceY += dy * dy;
+        }
+        
+        return covariance / Math.Sqrt(varianceX * varianceY);
+    }
+
     private List<int> DetectOutliers(double[] series, double threshold)
     {
         var mean = series.Mean();
@@ -1,6 +1,7 @@
 using Microsoft.SemanticKernel;
 using System.ComponentModel;
 using System.Text.Json;
+using QuantResearchAgent.Core;
 
 namespace QuantResearchAgent.Services;
 
@@ -10,6 +11,8 @@ namespace QuantResearchAgent.Services;
 /// </summary>
 public class TradingStrategyLibraryService
 {
+    private static readonly JsonSerializerOptions IndentedJsonOptions = new() { WriteIndented = true };
+
     private readonly Kernel _kernel;
     private readonly Dictionary<string, ITradingStrategy> _strategies = new();
 
@@ -47,7 +50,7 @@ public class TradingStrategyLibraryService
                 BacktestPeriod = backtestDays,
                 Results = result,
                 Timestamp = DateTime.UtcNow
-            }, new JsonSerializerOptions { WriteIndented = true });
+            }, IndentedJsonOptions);
         }
         catch (Exception ex)
         {
@@ -90,7 +93,7 @@ public class TradingStrategyLibraryService
 
             var comparison = await _kernel.InvokePromptAsync($@"
                 Analyze this strategy comparison for {symbol}:
-                {JsonSerializer.Serialize(ranking, new JsonSerializerOptions { WriteIndented = true })}
+                {JsonSerializer.Serialize(ranking, IndentedJsonOptions)}
                 
                 Provide:
                 1. Performance ranking with reasoning
@@ -99,7 +102,7 @@ public class TradingStrategyLibraryService
                 4. Recommendation for current market
                 5. Portfolio allocation suggestions
                 
-                Format output as PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+                Format output as {PromptFragments.PlainTextNoMarkdown}
             ");
 
             return comparison.ToString();
@@ -146,7 +149,7 @@ public class TradingStrategyLibraryService
                 AggregatedSignal = aggregatedSignal,
                 Confidence = CalculateSignalConfidence(signals),
                 Timestamp = DateTime.UtcNow
-            }, new JsonSerializerOptions { WriteIndented = true });
+            }, IndentedJsonOptions);
         }
         catch (Exception ex)
         {
@@ -181,7 +184,7 @@ public class TradingStrategyLibraryService
 
             var optimization = await _kernel.InvokePromptAsync($@"
                 Optimize this multi-strategy portfolio:
-                {JsonSerializer.Serialize(portfolioResults, new JsonSerializerOptions { WriteIndented = true })}
+                {JsonSerializer.Serialize(portfolioResults, IndentedJsonOptions)}
                 
                 Risk Tolerance: {riskTolerance}
                 
@@ -192,7 +195,7 @@ public class TradingStrategyLibraryService
                 4. Rebalancing schedule
                 5. Performance projections
                 
-                Format output as PLAIN TEXT ONLY - no markdown, no asterisks, no hashtags.
+                Format output as {PromptFragments.PlainTextNoMarkdown}
             ");
 
             return optimization.ToString();
@@ -17,6 +17,9 @@ using QuantResearchAgent.Plugins;
 
 public class YouTubeAnalysisService
 {
+    private const int MaxTechnicalInsights = 10;
+    private static readonly JsonSerializerOptions CaseInsensitiveJsonOptions = new() { PropertyNameCaseInsensitive = true };
+
     private readonly ILogger<YouTubeAnalysisService> _logger;
     private readonly IConfiguration _configuration;
     private readonly Kernel _kernel;
@@ -286,8 +289,7 @@ public class YouTubeAnalysisService
             var url = $"{YOUTUBE_API_BASE}/videos?part=snippet&id={videoId}&key={_youTubeApiKey}";
             var response = await _httpClient.GetStringAsync(url);
             _logger.LogDebug("YouTube API raw response for video {VideoId}: {Response}", videoId, response);
-            var options = new JsonSerializerOptions { PropertyNameCaseInsensitive = true };
-            var videoResult = JsonSerializer.Deserialize<YouTubeVideoResponse>(response, options);
+            var videoResult = JsonSerializer.Deserialize<YouTubeVideoResponse>(response, CaseInsensitiveJsonOptions);
 
             if (videoResult == null)
             {
@@ -323,9 +325,18 @@ public class YouTubeAnalysisService
         // Chunk transcript for region-specific prompts
         var regions = new[] { "USA", "China", "India", "Europe", "Global" };
         var regionResults = new List<string>();
+        var collectedInsightCount = 0;
 
         foreach (var region in regions)
         {
+            // Only the first MaxTechnicalInsights are kept, so skip remaining regions once they are collected
+            if (collectedInsightCount >= MaxTechnicalInsights)
+            {
+                _logger.LogInformation("Collected {InsightCount} insights, skipping remaining regions starting at {Region}",
+                    collectedInsightCount, region);
+                break;
+            }
+
             List<WebSearchResult> searchResults;
             try
             {
@@ -395,6 +406,7 @@ Format as simple numbered points with NO SPECIAL FORMATTING. Focus on actionable
                 var function = _kernel.CreateFunctionFromPrompt(prompt);
                 var result = await _kernel.InvokeAsync(function);
                 regionResults.Add(result.ToString());
+                collectedInsightCount += ParseTechnicalInsights(result.ToString()).Count;
             }
             catch (Exception ex)
             {
@@ -535,7 +547,7 @@ Educational content without strong directional bias should be close to 0.0.
             }
         }
         
-        return insights.Take(10).ToList(); // Limit to top 10 insights
+        return insights.Take(MaxTechnicalInsights).ToList(); // Limit to top insights
     }
 
     private List<string> ParseTradingSignals(string signalsText)
@@ -19,7 +19,7 @@ from config import (
 from utils import (
     setup_logging, ensure_directory_exists, format_lean_date,
     create_lean_tradebar_csv, write_lean_zip_file, get_trading_days,
-    DataValidator
+    is_day_file_complete, DataValidator
 )
 
 logger = setup_logging()
@@ -86,7 +86,8 @@ class AlpacaDataDownloader:
         
         return timeframe_map.get(timeframe, '1Min')
     
-    def download_symbol_data(self, symbol: str, resolution: str, start_date: datetime, end_date: datetime):
+    def download_symbol_data(self, symbol: str, resolution: str, start_date: datetime, end_date: datetime,
+                             overwrite: bool = False):
         """Download and save data for a single symbol"""
         logger.info(f"Downloading {symbol} data for {resolution} resolution")
         
@@ -126,9 +127,18 @@ class AlpacaDataDownloader:
             trading_days = get_trading_days(start_date, end_date)
             
             for date in tqdm(trading_days, desc=f"Downloading {symbol} {resolution}"):
+                date_str = format_lean_date(date)
+                symbol_dir = os.path.join(EQUITY_DATA_PATH, resolution, symbol.lower())
+                output_path = os.path.join(symbol_dir, f"{date_str}_trade.zip")
+                
                 date_start = date.replace(hour=0, minute=0, second=0)
                 date_end = date.replace(hour=23, minute=59, second=59)
                 
+                # Skip days whose file was written after the session closed; partial days are re-downloaded
+                if not overwrite and is_day_file_complete(output_path, date_end, LEAN_TIMEZONE_EQUITY):
+                    logger.debug(f"Skipping {symbol} on {date_str}, already downloaded")
+                    continue
+                
                 data = self.get_bars(symbol, resolution, date_start, date_end)
                 
                 if data:
@@ -137,12 +147,9 @@ class AlpacaDataDownloader:
                     
                     if cleaned_data:
                         # Create directory structure
-                        symbol_dir = os.path.join(EQUITY_DATA_PATH, resolution, symbol.lower())
                         ensure_directory_exists(symbol_dir)
                         
                         # Create file paths
-                        date_str = format_lean_date(date)
-                        output_path = os.path.join(symbol_dir, f"{date_str}_trade.zip")
                         csv_filename = f"{date_str}_{symbol.lower()}_{resolution}_trade.csv"
                         
                         # Convert to Lean format
@@ -155,13 +162,14 @@ class AlpacaDataDownloader:
                 # Rate limiting
                 time.sleep(self.rate_limit_delay)
     
-    def download_multiple_symbols(self, symbols: List[str], resolution: str, start_date: datetime, end_date: datetime):
+    def download_multiple_symbols(self, symbols: List[str], resolution: str, start_date: datetime, end_date: datetime,
+                                  overwrite: bool = False):
         """Download data for multiple symbols"""
         logger.info(f"Starting download for {len(symbols)} symbols")
         
         for symbol in tqdm(symbols, desc="Downloading symbols"):
             try:
-                self.download_symbol_data(symbol, resolution, start_date, end_date)
+                self.download_symbol_data(symbol, resolution, start_date, end_date, overwrite)
             except Exception as e:
                 logger.error(f"Error downloading {symbol}: {str(e)}")
                 continue
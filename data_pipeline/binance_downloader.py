@@ -18,7 +18,8 @@ from config import (
 )
 from utils import (
     setup_logging, ensure_directory_exists, format_lean_date,
-    create_lean_crypto_csv, write_lean_zip_file, DataValidator
+    create_lean_crypto_csv, write_lean_zip_file, is_day_file_complete,
+    DataValidator
 )
 
 logger = setup_logging()
@@ -82,7 +83,8 @@ class BinanceDataDownloader:
         
         return interval_map.get(interval, '1m')
     
-    def download_symbol_data(self, symbol: str, resolution: str, start_date: datetime, end_date: datetime):
+    def download_symbol_data(self, symbol: str, resolution: str, start_date: datetime, end_date: datetime,
+                             overwrite: bool = False):
         """Download and save data for a single symbol"""
         logger.info(f"Downloading {symbol} data for {resolution} resolution")
         
@@ -122,9 +124,19 @@ class BinanceDataDownloader:
             current_date = start_date
             
             while current_date <= end_date:
+                date_str = format_lean_date(current_date)
+                symbol_dir = os.path.join(CRYPTO_DATA_PATH, resolution, symbol.lower())
+                output_path = os.path.join(symbol_dir, f"{date_str}_trade.zip")
+                
                 date_start = current_date.replace(hour=0, minute=0, second=0)
                 date_end = current_date.replace(hour=23, minute=59, second=59)
                 
+                # Skip days whose file was written after the UTC day closed; partial days are re-downloaded
+                if not overwrite and is_day_file_complete(output_path, date_end, LEAN_TIMEZONE_CRYPTO):
+                    logger.debug(f"Skipping {symbol} on {date_str}, already downloaded")
+                    current_date += timedelta(days=1)
+                    continue
+                
                 data = self.get_klines(symbol, resolution, date_start, date_end)
                 
                 if data:
@@ -133,12 +145,9 @@ class BinanceDataDownloader:
                     
                     if cleaned_data:
                         # Create directory structure
-                        symbol_dir = os.path.join(CRYPTO_DATA_PATH, resolution, symbol.lower())
                         ensure_directory_exists(symbol_dir)
                         
                         # Create file paths
-                        date_str = format_lean_date(current_date)
-                        output_path = os.path.join(symbol_dir, f"{date_str}_trade.zip")
                         csv_filename = f"{date_str}_{symbol.lower()}_{resolution}_trade.csv"
                         
                         # Convert to Lean format
@@ -153,13 +162,14 @@ class BinanceDataDownloader:
                 # Rate limiting
                 time.sleep(self.rate_limit_delay)
     
-    def download_multiple_symbols(self, symbols: List[str], resolution: str, start_date: datetime, end_date: datetime):
+    def download_multiple_symbols(self, symbols: List[str], resolution: str, start_date: datetime, end_date: datetime,
+                                  overwrite: bool = False):
         """Download data for multiple symbols"""
         logger.info(f"Starting download for {len(symbols)} symbols")
         
         for symbol in tqdm(symbols, desc="Downloading symbols"):
             try:
-                self.download_symbol_data(symbol, resolution, start_date, end_date)
+                self.download_symbol_data(symbol, resolution, start_date, end_date, overwrite)
             except Exception as e:
                 logger.error(f"Error downloading {symbol}: {str(e)}")
                 continue
@@ -14,6 +14,13 @@ from utils import setup_logging
 
 logger = setup_logging()
 
+# Use pyarrow's multithreaded CSV parser when available
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
 class DataValidator:
     """Validate and analyze downloaded data"""
     
@@ -58,7 +65,7 @@ class DataValidator:
                 # Read the first CSV file
                 csv_filename = csv_files[0]
                 with zip_file.open(csv_filename) as csv_file:
-                    df = pd.read_csv(csv_file, header=None)
+                    df = pd.read_csv(csv_file, header=None, engine=CSV_ENGINE)
                     
                     # Validate CSV structure
                     if df.shape[1] != 6:
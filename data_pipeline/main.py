@@ -51,6 +51,8 @@ def main():
     # Other arguments
     parser.add_argument('--test', action='store_true',
                        help='Run in test mode with limited symbols and date range')
+    parser.add_argument('--overwrite', action='store_true',
+                       help='Re-download days whose data files already exist')
     
     args = parser.parse_args()
     
@@ -79,7 +81,8 @@ def main():
                 args.equity_symbols, 
                 args.resolution, 
                 args.start_date, 
-                args.end_date
+                args.end_date,
+                overwrite=args.overwrite
             )
             logger.info("Alpaca download completed")
         except Exception as e:
@@ -96,7 +99,8 @@ def main():
                 args.crypto_symbols, 
                 args.resolution, 
                 args.start_date, 
-                args.end_date
+                args.end_date,
+                overwrite=args.overwrite
             )
             logger.info("Binance download completed")
         except Exception as e:
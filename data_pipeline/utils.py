@@ -82,18 +82,20 @@ def create_lean_crypto_csv(data: List[Dict], symbol: str, date: datetime, resolu
     
     return csv_content
 
+# Number of CSV rows encoded per write when building Lean zip files
+LEAN_WRITE_BATCH_ROWS = 1000
+
 def write_lean_zip_file(csv_content: List[List], output_path: str, csv_filename: str):
     """Write CSV content to a zip file in Lean format"""
     ensure_directory_exists(os.path.dirname(output_path))
     
     with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # Create CSV content string
-        csv_string = ""
-        for row in csv_content:
-            csv_string += ",".join(str(item) for item in row) + "\n"
-        
-        # Add CSV to zip file
-        zip_file.writestr(csv_filename, csv_string)
+        # Stream CSV rows into the zip entry in batches rather than concatenating one large string
+        with zip_file.open(csv_filename, 'w') as csv_entry:
+            for start in range(0, len(csv_content), LEAN_WRITE_BATCH_ROWS):
+                batch = csv_content[start:start + LEAN_WRITE_BATCH_ROWS]
+                csv_chunk = "".join(",".join(str(item) for item in row) + "\n" for row in batch)
+                csv_entry.write(csv_chunk.encode('utf-8'))
 
 def validate_symbol(symbol: str, asset_type: str) -> bool:
     """Validate symbol format"""
@@ -129,6 +131,14 @@ def convert_timezone(dt: datetime, from_tz: str, to_tz: str) -> datetime:
     
     return converted_dt
 
+def is_day_file_complete(output_path: str, date_end: datetime, timezone: str) -> bool:
+    """Check whether a day file exists and was written after that day closed in the market timezone"""
+    if not os.path.exists(output_path):
+        return False
+    
+    day_close = convert_timezone(date_end, timezone, timezone)
+    return os.path.getmtime(output_path) > day_close.timestamp()
+
 class DataValidator:
     """Data validation utilities"""
     